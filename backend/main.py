@@ -67,7 +67,8 @@ async def webhook(request: Request):
 
 @handler.add(MessageEvent, message=TextMessage)
 def handle_message(event):
-    user_message = event.message.text
+    # Normalize full-width input (e.g. "３／１５ ＥＳ") before keyword matching
+    user_message = nlp_parser.normalize(event.message.text)
     line_uid = event.source.user_id
     
     # NLP Schedule Registration
@@ -133,6 +134,10 @@ async def get_schedules(line_uid: str, month: str = None):
         print(f"API Get Schedules Error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/parser/cache")
+async def get_parser_cache_stats():
+    return nlp_parser.cache_info()
+
 # Serve frontend static files (built React app)
 if os.path.exists("static"):
     app.mount("/", StaticFiles(directory="static", html=True), name="static")
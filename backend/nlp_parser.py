@@ -1,9 +1,10 @@
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import jaconv
 
 class ScheduleParser:
-    def __init__(self):
+    def __init__(self, cache_size: int = 512):
         self.type_keywords = {
             'ES_SUBMIT': ['ES', 'エントリーシート', '提出'],
             'SPI_TEST': ['SPI', 'テスト', '試験', 'Webテスト'],
@@ -14,12 +15,40 @@ class ScheduleParser:
             'EXPLANATION': ['説明会', 'セミナー'],
             'INTERNSHIP': ['インターン', 'インターンシップ']
         }
+        # Rich menu templates repeat the same messages, so cache per (text, day)
+        self._parse_cached = lru_cache(maxsize=cache_size)(self._parse)
+    
+    def normalize(self, text):
+        """Full-width ASCII/digits to half-width, half-width katakana to full-width"""
+        text = jaconv.z2h(text, kana=False, ascii=True, digit=True)
+        text = jaconv.h2z(text, kana=True, ascii=False, digit=False)
+        return text.strip()
     
     def parse(self, text):
         """Extract schedule info from natural language text"""
+        result = self._parse_cached(self.normalize(text), date.today())
+        # Return a copy so callers can't mutate the cached entry
+        return dict(result) if result else None
+    
+    def cache_info(self):
+        """Parse cache statistics including hit rate"""
+        info = self._parse_cached.cache_info()
+        total = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            'size': info.currsize,
+            'max_size': info.maxsize,
+            'hit_rate': info.hits / total if total else 0.0
+        }
+    
+    def cache_clear(self):
+        self._parse_cached.cache_clear()
+    
+    def _parse(self, text, today):
         # Extract Date
-        date = self._extract_date(text)
-        if not date:
+        schedule_date = self._extract_date(text, today)
+        if not schedule_date:
             return None
         
         # Extract Type
@@ -33,14 +62,15 @@ class ScheduleParser:
             return None
         
         return {
-            'schedule_date': date,
+            'schedule_date': schedule_date,
             'type_code': type_code,
             'company_name': company_name,
             'type_name': self._get_type_name(type_code)
         }
     
-    def _extract_date(self, text):
-        """Extract date information"""
+    def _extract_date(self, text, today):
+        """Extract date information relative to `today`"""
+        now = datetime(today.year, today.month, today.day)
         # MM/DD or MM月DD日
         patterns = [
             r'(\d{1,2})[/月](\d{1,2})[日]?',
@@ -54,12 +84,12 @@ class ScheduleParser:
                 if len(groups) == 2:
                     # MM/DD
                     month, day = int(groups[0]), int(groups[1])
-                    year = datetime.now().year
+                    year = now.year
                     # If date is in the past, assume next year
-                    date = datetime(year, month, day)
-                    if date < datetime.now() - timedelta(days=7): # allow 7 days buffer for potential "just passed" dates, but generally assume future
-                         date = datetime(year + 1, month, day)
-                    return date.strftime('%Y-%m-%d')
+                    parsed_date = datetime(year, month, day)
+                    if parsed_date < now - timedelta(days=7): # allow 7 days buffer for potential "just passed" dates, but generally assume future
+                         parsed_date = datetime(year + 1, month, day)
+                    return parsed_date.strftime('%Y-%m-%d')
                 elif len(groups) == 3:
                     # YYYY-MM-DD
                     year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
@@ -67,11 +97,11 @@ class ScheduleParser:
         
         # Relative dates
         if '明日' in text or 'あした' in text:
-            return (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+            return (now + timedelta(days=1)).strftime('%Y-%m-%d')
         elif '今日' in text or 'きょう' in text:
-            return datetime.now().strftime('%Y-%m-%d')
+            return now.strftime('%Y-%m-%d')
         elif '来週' in text: # Simply add 7 days for "next week" as a rough estimate if no day specified
-             return (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
+             return (now + timedelta(days=7)).strftime('%Y-%m-%d')
         
         return None
     
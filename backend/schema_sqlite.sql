@@ -0,0 +1,91 @@
+-- SQLite 스키마 (schema.sql 과 동일한 구조, DB_BACKEND=sqlite 용)
+
+-- 사용자 테이블
+CREATE TABLE IF NOT EXISTS users (
+    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    line_uid VARCHAR(100) UNIQUE NOT NULL,
+    display_name VARCHAR(100),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_active TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    timezone VARCHAR(50) DEFAULT 'Asia/Tokyo'
+);
+
+-- ON UPDATE CURRENT_TIMESTAMP 대체
+CREATE TRIGGER IF NOT EXISTS users_touch_last_active
+AFTER UPDATE ON users FOR EACH ROW WHEN NEW.last_active = OLD.last_active
+BEGIN
+    UPDATE users SET last_active = CURRENT_TIMESTAMP WHERE user_id = NEW.user_id;
+END;
+
+-- 일정 유형 테이블 (채용 프로세스 단계별 분류)
+CREATE TABLE IF NOT EXISTS schedule_types (
+    type_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    type_code VARCHAR(20) UNIQUE NOT NULL,
+    type_name_ja VARCHAR(50) NOT NULL,
+    type_name_ko VARCHAR(50) NOT NULL,
+    display_order INT NOT NULL,
+    color_code VARCHAR(7) DEFAULT '#4A90E2'
+);
+
+-- 기본 데이터 삽입 (존재하지 않을 경우에만)
+INSERT OR IGNORE INTO schedule_types (type_code, type_name_ja, type_name_ko, display_order, color_code) VALUES
+('ES_SUBMIT', 'ES提出', 'ES 제출', 1, '#FF6B6B'),
+('SPI_TEST', 'SPI試験', 'SPI 테스트', 2, '#4ECDC4'),
+('INTERVIEW_1', '一次面接', '1차 면접', 3, '#45B7D1'),
+('INTERVIEW_2', '二次面接', '2차 면접', 4, '#96CEB4'),
+('INTERVIEW_3', '三次面接', '3차 면접', 5, '#FFEAA7'),
+('FINAL_INTERVIEW', '最終面接', '최종 면접', 6, '#DDA15E'),
+('EXPLANATION', '会社説明会', '회사 설명회', 7, '#C9ADA7'),
+('INTERNSHIP', 'インターン', '인턴십', 8, '#B4A7D6'),
+('RESULT_NOTIFY', '結果通知日', '결과 통지일', 9, '#F9C74F'),
+('OTHER', 'その他', '기타', 10, '#90A4AE');
+
+-- 일정 테이블
+CREATE TABLE IF NOT EXISTS schedules (
+    schedule_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    type_id INTEGER NOT NULL,
+    company_name VARCHAR(200) NOT NULL,
+    schedule_date DATE NOT NULL,
+    schedule_time TIME,
+    location VARCHAR(300),
+    memo TEXT,
+    is_completed BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    FOREIGN KEY (type_id) REFERENCES schedule_types(type_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_user_date ON schedules (user_id, schedule_date);
+CREATE INDEX IF NOT EXISTS idx_schedule_date ON schedules (schedule_date);
+
+-- ON UPDATE CURRENT_TIMESTAMP 대체
+CREATE TRIGGER IF NOT EXISTS schedules_touch_updated_at
+AFTER UPDATE ON schedules FOR EACH ROW WHEN NEW.updated_at = OLD.updated_at
+BEGIN
+    UPDATE schedules SET updated_at = CURRENT_TIMESTAMP WHERE schedule_id = NEW.schedule_id;
+END;
+
+-- 알림 이력 테이블 (중복 발송 방지)
+CREATE TABLE IF NOT EXISTS notification_logs (
+    log_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    schedule_id INTEGER NOT NULL,
+    notification_type VARCHAR(10) NOT NULL CHECK (notification_type IN ('D-10', 'D-5', 'D-3', 'D-1', 'D-DAY')),
+    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_success BOOLEAN DEFAULT TRUE,
+    error_message TEXT,
+    FOREIGN KEY (schedule_id) REFERENCES schedules(schedule_id) ON DELETE CASCADE,
+    UNIQUE (schedule_id, notification_type)
+);
+
+-- 주간 리포트 발송 이력
+CREATE TABLE IF NOT EXISTS weekly_reports (
+    report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL,
+    report_date DATE NOT NULL,
+    schedules_count INT DEFAULT 0,
+    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE,
+    UNIQUE (user_id, report_date)
+);
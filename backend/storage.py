@@ -0,0 +1,211 @@
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Store dates as ISO strings so they compare correctly in SQL
+sqlite3.register_adapter(date, lambda d: d.isoformat())
+sqlite3.register_adapter(datetime, lambda d: d.isoformat(' '))
+
+
+@lru_cache(maxsize=256)
+def _to_qmark(sql: str) -> str:
+    """Convert %s placeholders to sqlite's ?; cached so the same SQL string hits the statement cache"""
+    return sql.replace('%s', '?')
+
+
+class Transaction:
+    """Cursor wrapper passed to StorageBackend.transaction() callbacks"""
+
+    def __init__(self, cursor, convert: Callable[[str], str] = lambda sql: sql):
+        self.cursor = cursor
+        self.convert = convert
+
+    def fetch_one(self, sql: str, params: Sequence = ()) -> Optional[Dict[str, Any]]:
+        self.cursor.execute(self.convert(sql), tuple(params))
+        row = self.cursor.fetchone()
+        return dict(row) if row is not None else None
+
+    def fetch_all(self, sql: str, params: Sequence = ()) -> List[Dict[str, Any]]:
+        self.cursor.execute(self.convert(sql), tuple(params))
+        return [dict(row) for row in self.cursor.fetchall()]
+
+    def execute(self, sql: str, params: Sequence = ()) -> int:
+        self.cursor.execute(self.convert(sql), tuple(params))
+        return self.cursor.lastrowid
+
+
+class StorageBackend:
+    """Storage interface behind Database. SQL is written with %s placeholders."""
+    dialect = ''
+    schema_path = ''
+
+    def transaction(self, fn: Callable[[Transaction], Any]) -> Any:
+        """Run fn(tx) in a single transaction and return its result"""
+        raise NotImplementedError
+
+    def init_schema(self, schema_path: str):
+        raise NotImplementedError
+
+    def fetch_one(self, sql: str, params: Sequence = ()) -> Optional[Dict[str, Any]]:
+        return self.transaction(lambda tx: tx.fetch_one(sql, params))
+
+    def fetch_all(self, sql: str, params: Sequence = ()) -> List[Dict[str, Any]]:
+        return self.transaction(lambda tx: tx.fetch_all(sql, params))
+
+    def execute(self, sql: str, params: Sequence = ()) -> int:
+        return self.transaction(lambda tx: tx.execute(sql, params))
+
+    def close(self):
+        pass
+
+
+class MySQLBackend(StorageBackend):
+    dialect = 'mysql'
+    schema_path = 'schema.sql'
+
+    def __init__(self):
+        self.host = os.getenv('DB_HOST', 'localhost')
+        self.user = os.getenv('DB_USER', 'root')
+        self.password = os.getenv('DB_PASSWORD', '')
+        self.database = os.getenv('DB_NAME', 'recruitment_schedule')
+
+    def get_connection(self):
+        # Imported here so sqlite-only deployments don't need the driver
+        import mysql.connector
+        return mysql.connector.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database
+        )
+
+    def transaction(self, fn: Callable[[Transaction], Any]) -> Any:
+        conn = self.get_connection()
+        cursor = conn.cursor(dictionary=True)
+        try:
+            result = fn(Transaction(cursor))
+            conn.commit()
+            return result
+        finally:
+            cursor.close()
+            conn.close()
+
+    def init_schema(self, schema_path: str):
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            with open(schema_path, 'r', encoding='utf-8') as f:
+                schema_sql = f.read()
+
+            # Split assertions because mysql connector can't do multiple at once easily safely
+            # or requires multi=True
+            statements = schema_sql.split(';')
+
+            for statement in statements:
+                if statement.strip():
+                    try:
+                        cursor.execute(statement)
+                    except Exception as e:
+                        print(f"Schema Init Warning (might be expected): {e}")
+
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+
+
+class SQLiteBackend(StorageBackend):
+    """Embedded SQLite in WAL mode: one writer thread, per-thread read-only connections"""
+    dialect = 'sqlite'
+    schema_path = 'schema_sqlite.sql'
+
+    def __init__(self, path: str = None):
+        self.path = path or os.getenv('SQLITE_PATH', 'recruitment_schedule.db')
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        # All writes are serialized on a single thread that owns the write connection
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sqlite-writer')
+
+    def _connect(self) -> sqlite3.Connection:
+        # Each connection stays on one thread; check_same_thread is off only so close() can reach them
+        conn = sqlite3.connect(self.path, timeout=5, cached_statements=256, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA busy_timeout = 5000')
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'reader', None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute('PRAGMA query_only = ON')
+            self._local.reader = conn
+        return conn
+
+    def _write_connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'writer', None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA synchronous = NORMAL')
+            conn.execute('PRAGMA foreign_keys = ON')
+            self._local.writer = conn
+        return conn
+
+    def _run_write(self, fn: Callable[[Transaction], Any]) -> Any:
+        conn = self._write_connection()
+        cursor = conn.cursor()
+        try:
+            result = fn(Transaction(cursor, _to_qmark))
+            conn.commit()
+            return result
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def transaction(self, fn: Callable[[Transaction], Any]) -> Any:
+        return self._writer.submit(self._run_write, fn).result()
+
+    def fetch_one(self, sql: str, params: Sequence = ()) -> Optional[Dict[str, Any]]:
+        cursor = self._reader().cursor()
+        try:
+            return Transaction(cursor, _to_qmark).fetch_one(sql, params)
+        finally:
+            cursor.close()
+
+    def fetch_all(self, sql: str, params: Sequence = ()) -> List[Dict[str, Any]]:
+        cursor = self._reader().cursor()
+        try:
+            return Transaction(cursor, _to_qmark).fetch_all(sql, params)
+        finally:
+            cursor.close()
+
+    def init_schema(self, schema_path: str):
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            schema_sql = f.read()
+        self.transaction(lambda tx: tx.cursor.executescript(schema_sql))
+
+    def close(self):
+        self._writer.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+
+
+def create_backend(name: str = None) -> StorageBackend:
+    """Pick the storage backend from DB_BACKEND (mysql or sqlite)"""
+    name = (name or os.getenv('DB_BACKEND', 'mysql')).lower()
+    if name == 'mysql':
+        return MySQLBackend()
+    if name == 'sqlite':
+        return SQLiteBackend()
+    raise ValueError(f"Unknown DB_BACKEND: {name}")